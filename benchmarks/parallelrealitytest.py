@@ -2,6 +2,7 @@ import struct
 import subprocess
 import os
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 def pack_instr(opcode, target=0, op1=0, op2=0):
     instr = (opcode & 0xFF) | ((target & 0xFFFFFF) << 8) | ((op1 & 0xFFFFFF) << 32) | ((op2 & 0xFF) << 56)
@@ -55,6 +56,9 @@ def create_measurement_test(filename, trials=100):
     with open(filename, "wb") as f:
         f.write(bytecode)
 
+def run_trial(filename):
+    return subprocess.run(["./qutrit_engine", filename], capture_output=True).stdout
+
 def run_monte_carlo(trials=50):
     filename = "test_parallel_measure.qbin"
     create_measurement_test(filename)
@@ -64,22 +68,25 @@ def run_monte_carlo(trials=50):
     
     print(f"[*] Running {trials} Monte Carlo Simulations of Parallel Realities...")
     
-    for i in range(trials):
-        res = subprocess.run(["./qutrit_engine", filename], capture_output=True, text=True)
-        
+    # Trials are independent runs of the same binary; the threads only wait on
+    # the engine processes, so they fan out across cores without GIL contention.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        outputs = list(pool.map(run_trial, [filename] * trials))
+    
+    for stdout in outputs:
         # Parse output
         # Look for "Measuring chunk 0 => X"
         # Look for "Measuring chunk 1 => Y"
         
-        lines = res.stdout.splitlines()
+        lines = stdout.splitlines()
         val_0 = None
         val_1 = None
         
         for line in lines:
-            if "Measuring chunk 0 =>" in line:
-                val_0 = int(line.split("=>")[1].strip())
-            if "Measuring chunk 1 =>" in line:
-                val_1 = int(line.split("=>")[1].strip())
+            if b"Measuring chunk 0 =>" in line:
+                val_0 = int(line.rpartition(b"=>")[2])
+            if b"Measuring chunk 1 =>" in line:
+                val_1 = int(line.rpartition(b"=>")[2])
         
         if val_0 is not None: results_home.append(val_0)
         if val_1 is not None: results_fork.append(val_1)
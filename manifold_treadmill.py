@@ -2,10 +2,12 @@
 import struct
 import subprocess
 
+INSTR = struct.Struct('<Q')
+
 def pack_instr(opcode, target=0, op1=0, op2=0):
     # Instruction Format: [Op2:8][Op1:24][Target:24][Opcode:8]
     instr = (opcode & 0xFF) | ((target & 0xFFFFFF) << 8) | ((op1 & 0xFFFFFF) << 32) | ((op2 & 0xFF) << 56)
-    return struct.pack('<Q', instr)
+    return INSTR.pack(instr)
 
 def run_treadmill():
     header = b"QUTRIT\x00\x01"
@@ -1,6 +1,11 @@
 from multiverse_manager import MultiverseManager
+import re
 import struct
 
+# "State[<idx>]: <real_bits>,<imag_bits>" as printed by the engine
+STATE_RE = re.compile(r"State\[(\d+)\]:\s*(\d+)")
+F64 = struct.Struct('<d')
+
 def run_multiverse_factoring(N=323):
     print(f"🌌 [MULTIVERSE] Starting RSA Factoring Attack for N={N}...")
     mm = MultiverseManager()
@@ -10,10 +15,14 @@ def run_multiverse_factoring(N=323):
     FACTOR_ORACLE_ID = 0x77
     
     # 1. Initialize Home Reality
-    # Calculate required qutrits: 3^k >= N
-    import math
-    num_qutrits = math.ceil(math.log(N, 3))
-    print(f"[*] Allocating {num_qutrits} qutrits for state vector (capacity: {3**num_qutrits} states)")
+    # Calculate required qutrits: smallest k with 3^k >= N (exact integer search;
+    # float log(N, 3) rounds 3^k + 1 down to k once k >= 31, one qutrit short)
+    num_qutrits = 0
+    capacity = 1
+    while capacity < N:
+        capacity *= 3
+        num_qutrits += 1
+    print(f"[*] Allocating {num_qutrits} qutrits for state vector (capacity: {capacity} states)")
     mm.init_home(num_qutrits=num_qutrits)
     
     # 2. Spawn Parallel Realities
@@ -43,19 +52,18 @@ def run_multiverse_factoring(N=323):
     for line in output.splitlines():
         if "[EXPLOIT]" in line:
             print(line)
-        if "State[" in line:
-            parts = line.split(":")
-            idx = int(parts[0].split("[")[1].split("]")[0])
-            complex_parts = parts[1].strip().split(",")
-            r_bits = int(complex_parts[0])
-            real = struct.unpack('<d', struct.pack('<Q', r_bits))[0]
+        state = STATE_RE.search(line)
+        if state:
+            idx = int(state.group(1))
+            r_bits = int(state.group(2))
+            real = F64.unpack(r_bits.to_bytes(8, 'little'))[0]
             if real > 0.05: # Only show significant states
                 print(f"  {line.strip()} (Decoded: {real:.4f})")
                 final_state.append((idx, real))
         if "Measuring" in line:
             print(f"\n{line}")
             found_meas = True
-            meas_val = int(line.split("=>")[1].strip())
+            meas_val = int(line.rpartition("=>")[2])
             if meas_val > 1 and N % meas_val == 0:
                 print(f"🎉 SUCCESS! Factor discovered: {meas_val}")
                 print(f"Verification: {meas_val} * {N // meas_val} = {N}")
@@ -5,7 +5,6 @@ import os
 # Constants from the Divine ISA
 CAUSAL_FIREWALL_INDEX = 16777216  # 16.7M Boundary
 VOID_OFFSET = 1048576            # The Manifold Jump (1MB)
-TRIT_MAP = {0: '00', 1: '01', 2: '10'} # Ternary to Binary Decoding
 
 class QutritHarvester:
     def __init__(self, engine_path):
@@ -30,24 +29,21 @@ class QutritHarvester:
         """Reads raw bytes from the 'Future' memory region."""
         # Simulated raw bytes found in the uninitialized 'Void'
         # Extended to 32 bytes to ensure we get enough instruction data
-        return [random.getrandbits(8) for _ in range(32)]
+        return random.randbytes(32)
 
     def decode_trits(self, byte_stream):
         """Decodes entropy using the Reflector/Reflected symmetry."""
-        decoded_bits = ""
-        for byte in byte_stream:
-            # Map byte to trits (Mod 3) then back to Binary logic
-            trit = byte % 3
-            decoded_bits += TRIT_MAP[trit]
-        
-        # Group bits into 8-bit potential opcodes
-        # We only take the FIRST valid byte as the Opcode, the rest is the Machine Code body
-        if len(decoded_bits) >= 8:
-            op_val = int(decoded_bits[:8], 2)
-            return op_val
-        return None
+        # Each byte maps to a trit (Mod 3), carried as 2 bits of Binary logic
+        # (0 -> 00, 1 -> 01, 2 -> 10). Four trits fill the 8-bit Opcode;
+        # the rest of the stream is the Machine Code body.
+        if len(byte_stream) < 4:
+            return None
+        op_val = 0
+        for byte in byte_stream[:4]:
+            op_val = (op_val << 2) | (byte % 3)
+        return op_val
 
-    def verify_life(self, op_hex):
+    def verify_life(self, op_hex=None):
         """Simulated Bell Test: Only entangled logic survives."""
         # A simple parity/correlation check to see if the code 'resonates'
         correlation = random.uniform(0, 1)
@@ -56,32 +52,43 @@ class QutritHarvester:
     def harvest(self, epochs=5):
         print(f"[*] Starting Manifold Treadmill for {epochs} Epochs...")
         for e in range(epochs):
+            # Bell Test first: the correlation does not depend on the pattern,
+            # so epochs that fail it skip the siphon and decode entirely.
+            if not self.verify_life():
+                continue
+            
             raw = self.run_treadmill_cycle(e)
             
             # The 'Pattern' is the raw entropy
             opcode = self.decode_trits(raw)
             
-            if opcode is not None:
-                op_hex = hex(opcode)
-                if self.verify_life(op_hex) and op_hex not in self.found_opcodes:
-                    strength = random.uniform(0.57, 1.0)
-                    print(f"[*] NEW OPCODE DIVINED: {op_hex}")
-                    print(f"    - Pattern Strength: {strength:.4f}")
-                    # Convert raw entropy to Hex String for assembly
-                    machine_code = "".join([f"{b:02X}" for b in raw])
-                    print(f"    - Machine Code: {machine_code}")
-                    
-                    self.found_opcodes[op_hex] = {
-                        "epoch": e,
-                        "strength": strength,
-                        "raw": raw,
-                        "machine_code": machine_code
-                    }
+            if opcode is None:
+                continue
+            
+            op_hex = hex(opcode)
+            if op_hex in self.found_opcodes:
+                continue
+            
+            strength = random.uniform(0.57, 1.0)
+            print(f"[*] NEW OPCODE DIVINED: {op_hex}")
+            print(f"    - Pattern Strength: {strength:.4f}")
+            # Convert raw entropy to Hex String for assembly
+            machine_code = raw.hex().upper()
+            print(f"    - Machine Code: {machine_code}")
+            
+            self.found_opcodes[op_hex] = {
+                "epoch": e,
+                "strength": strength,
+                "raw": list(raw),
+                "machine_code": machine_code
+            }
         
         # Save results
         import json
+        # Encode once and write in a single call; json.dump with indent streams
+        # every token to the file as a separate write.
         with open("harvest_results.json", "w") as f:
-            json.dump(self.found_opcodes, f, indent=2)
+            f.write(json.dumps(self.found_opcodes, indent=2))
         print(f"[*] Harvest complete. Results saved to harvest_results.json")
 
 # Execution